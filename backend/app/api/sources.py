@@ -1,6 +1,10 @@
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from datetime import datetime
+import msgspec
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, insert, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -10,78 +14,254 @@ from app.schemas.source import (
     SourceUpdate,
     SourceResponse,
     SourceListResponse,
+    SourceOut,
+    SourceLocationOut,
 )
 
 router = APIRouter(prefix="/sources", tags=["sources"])
 
+# Built once at import. Rows are validated from attributes and dumped to
+# JSON-ready dicts here, so FastAPI doesn't run a second response_model pass.
+_RESP_ADAPTER = TypeAdapter(SourceResponse)
 
-@router.get("", response_model=SourceListResponse)
-async def list_sources(db: AsyncSession = Depends(get_db)):
-    """List all configured camera/sensor sources."""
-    result = await db.execute(select(Source).order_by(Source.created_at))
-    sources = result.scalars().all()
+# The list is rendered to JSON by Postgres and passed through untouched, so
+# every value is spelled the way SourceResponse serializes it:
+#   - password is stripped; enum columns are stored by member name (RTSP,
+#     LAND) and lowered back to their API values
+#   - floats always carry a decimal point (5.0, not 5)
+#   - timestamps are UTC with a Z suffix, microseconds only when nonzero,
+#     whatever the session TimeZone
+#   - location is normalized to all six SourceLocation keys
+# `total` counts every matching row, not just the returned page.
 
-    return SourceListResponse(
-        sources=[SourceResponse.model_validate(s) for s in sources],
-        total=len(sources),
+
+def _float_json(expr: str) -> str:
+    """SQL rendering a float8 expression as a JSON number like Python's (5.0, 0.1)."""
+    return (
+        f"(CASE WHEN ({expr}) IS NULL THEN 'null' "
+        f"WHEN ({expr})::text ~ '^-?[0-9]+$' THEN ({expr})::text || '.0' "
+        f"ELSE ({expr})::text END)::jsonb"
+    )
+
+
+def _timestamp_json(col: str) -> str:
+    """SQL rendering a timestamptz as a JSON string like pydantic."""
+    utc = f"({col} AT TIME ZONE 'UTC')"
+    return (
+        f"to_jsonb(to_char({utc}, 'YYYY-MM-DD\"T\"HH24:MI:SS') "
+        f"|| CASE WHEN to_char({utc}, 'US') = '000000' THEN '' "
+        f"ELSE to_char({utc}, '.US') END || 'Z')"
+    )
+
+
+_LOCATION_KEYS = ("lat", "lon", "facility_x", "facility_y", "fov_angle", "fov_width")
+
+_LOCATION_JSON = (
+    "CASE WHEN s.location IS NULL OR json_typeof(s.location) = 'null' THEN 'null'::jsonb "
+    "ELSE jsonb_build_object("
+    + ", ".join(f"'{k}', {_float_json(f'(s.location->>{k!r})::float8')}" for k in _LOCATION_KEYS)
+    + ") END"
+)
+
+_LIST_SQL = text(
+    f"""
+    SELECT
+        COALESCE(
+            jsonb_agg(
+                (to_jsonb(s) - 'password')
+                || jsonb_build_object(
+                    'type', lower(s.type::text),
+                    'domain', lower(s.domain::text),
+                    'reconnect_delay_s', {_float_json("s.reconnect_delay_s")},
+                    'timeout_s', {_float_json("s.timeout_s")},
+                    'location', {_LOCATION_JSON},
+                    'created_at', {_timestamp_json("s.created_at")},
+                    'updated_at', {_timestamp_json("s.updated_at")}
+                )
+                ORDER BY s.created_at, s.id
+            ),
+            '[]'::jsonb
+        )::text AS sources,
+        (
+            SELECT count(*) FROM sources
+            WHERE CAST(:since AS timestamptz) IS NULL OR updated_at > :since
+        ) AS total
+    FROM (
+        SELECT * FROM sources
+        WHERE CAST(:since AS timestamptz) IS NULL OR updated_at > :since
+        ORDER BY created_at, id
+        LIMIT :limit OFFSET :offset
+    ) s
+    """
+)
+
+# Fingerprint of the table contents plus the query. Any insert/update moves
+# max(updated_at), any delete changes count(*).
+_ETAG_SQL = text(
+    """
+    SELECT md5(coalesce(max(updated_at)::text, '') || '|' || count(*)::text || '|' || :query)
+    FROM sources
+    """
+)
+
+# Built once and reused; per-request construction only costs Python time
+_GET_STMT = select(Source).where(Source.id == bindparam("sid"))
+
+
+_ENCODER = msgspec.json.Encoder()
+
+
+def _dump(source: Source) -> dict:
+    # dump_python() only takes model instances; from_attributes belongs to validation
+    return _RESP_ADAPTER.dump_python(
+        _RESP_ADAPTER.validate_python(source, from_attributes=True), mode="json"
+    )
+
+
+def _to_out(source: Source) -> SourceOut:
+    loc = source.location
+    return SourceOut(
+        id=source.id,
+        name=source.name,
+        type=source.type,
+        uri=source.uri,
+        enabled=source.enabled,
+        target_fps=source.target_fps,
+        native_fps=source.native_fps,
+        resolution_w=source.resolution_w,
+        resolution_h=source.resolution_h,
+        reconnect_attempts=source.reconnect_attempts,
+        reconnect_delay_s=source.reconnect_delay_s,
+        timeout_s=source.timeout_s,
+        username=source.username,
+        location=SourceLocationOut(**loc) if loc else None,
+        domain=source.domain,
+        zone_id=source.zone_id,
+        vendor=source.vendor,
+        model=source.model,
+        created_at=source.created_at,
+        updated_at=source.updated_at,
     )
 
 
-@router.get("/{source_id}", response_model=SourceResponse)
+@router.get(
+    "",
+    response_model=None,
+    response_class=Response,
+    responses={200: {"model": SourceListResponse}},
+)
+async def list_sources(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    updated_since: datetime | None = None,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    List configured camera/sensor sources, oldest first, one page at a time.
+
+    Responses carry an ETag; send it back as If-None-Match to get
+    304 Not Modified while nothing has changed.
+    """
+    query = f"{limit}|{offset}|{updated_since.isoformat() if updated_since else ''}"
+    etag = '"' + (await db.execute(_ETAG_SQL, {"query": query})).scalar_one() + '"'
+
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    sources, total = (
+        await db.execute(
+            _LIST_SQL, {"since": updated_since, "limit": limit, "offset": offset}
+        )
+    ).one()
+
+    return Response(
+        content=b'{"total":' + str(total).encode() + b',"sources":' + sources.encode() + b"}",
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
+@router.get(
+    "/{source_id}",
+    response_model=None,
+    response_class=Response,
+    responses={200: {"model": SourceResponse}},
+)
 async def get_source(source_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Get a single source by ID."""
-    source = await db.get(Source, source_id)
+    source = (await db.execute(_GET_STMT, {"sid": source_id})).scalar_one_or_none()
     if not source:
         raise HTTPException(status_code=404, detail=f"Source {source_id} not found")
-    return SourceResponse.model_validate(source)
+    return Response(content=_ENCODER.encode(_to_out(source)), media_type="application/json")
 
 
-@router.post("", response_model=SourceResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=None,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": SourceResponse}},
+)
 async def create_source(payload: SourceCreate, db: AsyncSession = Depends(get_db)):
     """Create a new camera/sensor source."""
-    source = Source(
-        **payload.model_dump(
-            exclude={"location"},
-            exclude_unset=False,
-        ),
-        location=payload.location.model_dump() if payload.location else None,
-    )
-    db.add(source)
+    values = payload.model_dump(exclude={"location"}, exclude_unset=False)
+    values["location"] = payload.location.model_dump() if payload.location else None
+
+    # INSERT ... RETURNING hands back the full row (id and timestamps come from
+    # the column defaults), so no refresh SELECT is needed after commit
+    source = (
+        await db.execute(insert(Source).values(**values).returning(Source))
+    ).scalar_one()
+    # Serialize before committing, so a response error can't leave the row behind
+    body = _dump(source)
     await db.commit()
-    await db.refresh(source)
-    return SourceResponse.model_validate(source)
+    return ORJSONResponse(body, status_code=status.HTTP_201_CREATED)
 
 
-@router.patch("/{source_id}", response_model=SourceResponse)
+@router.patch(
+    "/{source_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": SourceResponse}},
+)
 async def update_source(
     source_id: uuid.UUID,
     payload: SourceUpdate,
     db: AsyncSession = Depends(get_db),
 ):
     """Update an existing source. Only provided fields are updated."""
-    source = await db.get(Source, source_id)
-    if not source:
-        raise HTTPException(status_code=404, detail=f"Source {source_id} not found")
-
     update_data = payload.model_dump(exclude_unset=True)
 
-    # Handle nested location object
+    # Handle nested location object (stored whole, not merged)
     if "location" in update_data:
-        loc = update_data.pop("location")
-        source.location = loc.model_dump() if loc else None
+        update_data["location"] = payload.location.model_dump() if payload.location else None
 
-    for key, value in update_data.items():
-        setattr(source, key, value)
+    # One round-trip: UPDATE ... RETURNING (updated_at is bumped by its onupdate)
+    source = (
+        await db.execute(
+            update(Source)
+            .where(Source.id == source_id)
+            .values(**update_data)
+            .returning(Source)
+        )
+    ).scalar_one_or_none()
+    if not source:
+        raise HTTPException(status_code=404, detail=f"Source {source_id} not found")
 
+    # Serialize before committing, so a response error can't leave the update behind
+    body = _dump(source)
     await db.commit()
-    await db.refresh(source)
-    return SourceResponse.model_validate(source)
+    return ORJSONResponse(body)
 
 
 @router.delete("/{source_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_source(source_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Delete a source."""
-    source = await db.get(Source, source_id)
+    source = (await db.execute(_GET_STMT, {"sid": source_id})).scalar_one_or_none()
     if not source:
         raise HTTPException(status_code=404, detail=f"Source {source_id} not found")
 
@@ -1,8 +1,15 @@
-from pydantic_settings import BaseSettings
+from dataclasses import dataclass, field, fields
 from functools import lru_cache
+import json
+import os
 
+from dotenv import dotenv_values
 
-class Settings(BaseSettings):
+
+# Plain frozen dataclass: a dozen flat fields don't need a pydantic model build
+# at import. Values come from the environment / .env, cast to the field type.
+@dataclass(frozen=True, slots=True)
+class Settings:
     # App
     app_name: str = "Argus C2 Backend"
     debug: bool = True
@@ -21,11 +28,36 @@ class Settings(BaseSettings):
     perception_url: str = "http://localhost:8100"
 
     # CORS
-    cors_origins: list[str] = ["http://localhost:5173", "http://localhost:3000"]
+    cors_origins: list[str] = field(
+        default_factory=lambda: ["http://localhost:5173", "http://localhost:3000"]
+    )
+
+
+ENV_FILE = "../.env"
+
 
-    model_config = {"env_file": "../.env", "extra": "ignore"}
+def _cast(raw: str, typ: type):
+    """Convert an environment string to the field's declared type."""
+    if typ is bool:
+        return raw.strip().lower() in ("1", "true", "yes", "on")
+    if typ in (int, float, str):
+        return typ(raw)
+    # list[str]: JSON array or comma-separated
+    raw = raw.strip()
+    if raw.startswith("["):
+        return json.loads(raw)
+    return [item.strip() for item in raw.split(",") if item.strip()]
 
 
 @lru_cache
 def get_settings() -> Settings:
-    return Settings()
+    # Same precedence as before: process environment wins over the .env file
+    env = {k.upper(): v for k, v in dotenv_values(ENV_FILE).items() if v is not None}
+    env.update((k.upper(), v) for k, v in os.environ.items())
+
+    overrides = {
+        f.name: _cast(env[f.name.upper()], f.type)
+        for f in fields(Settings)
+        if f.name.upper() in env
+    }
+    return Settings(**overrides)
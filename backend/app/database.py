@@ -1,14 +1,23 @@
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 from app.config import get_settings
 
 settings = get_settings()
 
+
+def _json_dumps(obj) -> str:
+    return orjson.dumps(obj).decode()
+
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     pool_size=5,
     max_overflow=10,
+    # JSON/JSONB columns (e.g. Source.location) round-trip through orjson
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
 )
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
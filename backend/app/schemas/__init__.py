@@ -5,6 +5,8 @@ from app.schemas.source import (
     SourceStatusResponse,
     SourceListResponse,
     SourceLocation,
+    SourceOut,
+    SourceLocationOut,
 )
 
 __all__ = [
@@ -14,4 +16,6 @@ __all__ = [
     "SourceStatusResponse",
     "SourceListResponse",
     "SourceLocation",
+    "SourceOut",
+    "SourceLocationOut",
 ]
@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+import msgspec
 from pydantic import BaseModel, Field
 from app.models.source import SourceType, SourceDomain, SourceState
 
@@ -104,6 +105,48 @@ class SourceResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+# ─── Read path (msgspec) ────────────────────────────────
+# Same shape as SourceResponse. Reads don't need validation, and msgspec
+# encodes these straight to JSON bytes without walking pydantic fields.
+
+class SourceLocationOut(msgspec.Struct):
+    lat: float | None = None
+    lon: float | None = None
+    facility_x: float | None = None
+    facility_y: float | None = None
+    fov_angle: float | None = None
+    fov_width: float | None = None
+
+
+class SourceOut(msgspec.Struct):
+    id: uuid.UUID
+    name: str
+    type: SourceType
+    uri: str
+    enabled: bool
+
+    target_fps: int
+    native_fps: int | None
+    resolution_w: int | None
+    resolution_h: int | None
+
+    reconnect_attempts: int
+    reconnect_delay_s: float
+    timeout_s: float
+
+    username: str | None
+
+    location: SourceLocationOut | None
+    domain: SourceDomain
+    zone_id: uuid.UUID | None
+
+    vendor: str | None
+    model: str | None
+
+    created_at: datetime
+    updated_at: datetime
+
+
 # ─── Status (real-time, from perception service) ────────
 
 class SourceStatusResponse(BaseModel):
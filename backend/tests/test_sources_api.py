@@ -0,0 +1,138 @@
+"""
+Write endpoints of /api/v1/sources, against a stand-in session.
+
+The stand-in hands back a Source row the way get()/refresh() or
+INSERT/UPDATE ... RETURNING would, so these cover the response path
+without a running Postgres.
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import get_db
+from app.main import app
+from app.models.source import Source, SourceDomain, SourceType
+
+
+class _Result:
+    def __init__(self, row):
+        self._row = row
+
+    def scalar_one(self):
+        assert self._row is not None
+        return self._row
+
+    def scalar_one_or_none(self):
+        return self._row
+
+
+class _Session:
+    """Just enough AsyncSession for the write endpoints."""
+
+    def __init__(self, row):
+        self.row = row
+        self.commits = 0
+
+    def add(self, obj):
+        pass
+
+    async def get(self, model, ident):
+        return self.row
+
+    async def refresh(self, obj):
+        # Fill what the database would have: id, timestamps, column defaults
+        for column in Source.__table__.columns:
+            if getattr(obj, column.key) is None:
+                setattr(obj, column.key, getattr(self.row, column.key))
+
+    async def execute(self, stmt, params=None):
+        return _Result(self.row)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _source(**overrides) -> Source:
+    now = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    values = dict(
+        id=uuid.uuid4(),
+        name="Entry Gate",
+        type=SourceType.RTSP,
+        uri="rtsp://192.168.1.100/stream1",
+        enabled=True,
+        target_fps=10,
+        native_fps=None,
+        resolution_w=None,
+        resolution_h=None,
+        reconnect_attempts=-1,
+        reconnect_delay_s=5.0,
+        timeout_s=10.0,
+        username="admin",
+        password="secret",
+        location={"lat": 1.5, "lon": 2.5},
+        domain=SourceDomain.LAND,
+        zone_id=None,
+        vendor=None,
+        model=None,
+        created_at=now,
+        updated_at=now,
+    )
+    values.update(overrides)
+    return Source(**values)
+
+
+@pytest.fixture
+def session():
+    holder = _Session(_source())
+    app.dependency_overrides[get_db] = lambda: holder
+    yield holder
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture
+def client():
+    # No `with`: the lifespan would try to create tables in a real database
+    return TestClient(app)
+
+
+def test_create_source_returns_row(client, session):
+    resp = client.post(
+        "/api/v1/sources",
+        json={
+            "name": "Entry Gate",
+            "type": "rtsp",
+            "uri": "rtsp://192.168.1.100/stream1",
+            "location": {"lat": 1.5, "lon": 2.5},
+        },
+    )
+
+    assert resp.status_code == 201
+    body = resp.json()
+    assert body["id"] == str(session.row.id)
+    assert body["type"] == "rtsp"
+    assert body["domain"] == "land"
+    assert body["location"]["lat"] == 1.5
+    assert "password" not in body
+    assert session.commits == 1
+
+
+def test_update_source_returns_row(client, session):
+    session.row = _source(name="Renamed")
+
+    resp = client.patch(f"/api/v1/sources/{session.row.id}", json={"name": "Renamed"})
+
+    assert resp.status_code == 200
+    assert resp.json()["name"] == "Renamed"
+    assert session.commits == 1
+
+
+def test_update_missing_source_is_404(client, session):
+    session.row = None
+
+    resp = client.patch(f"/api/v1/sources/{uuid.uuid4()}", json={"name": "Renamed"})
+
+    assert resp.status_code == 404
+    assert session.commits == 0
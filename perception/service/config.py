@@ -1,8 +1,14 @@
-from pydantic_settings import BaseSettings
+from dataclasses import dataclass, fields
 from functools import lru_cache
+import os
 
+from dotenv import dotenv_values
 
-class Settings(BaseSettings):
+
+# Plain frozen dataclass: a dozen flat fields don't need a pydantic model build
+# at import. Values come from the environment / .env, cast to the field type.
+@dataclass(frozen=True, slots=True)
+class Settings:
     # Server
     perception_host: str = "0.0.0.0"
     perception_port: int = 8100
@@ -17,15 +23,42 @@ class Settings(BaseSettings):
     default_target_fps: int = 10
     max_sources: int = 10
     frame_queue_size: int = 30  # frames buffered per source
+    frame_pool: str = "local"  # "local", or "shared" (shared memory, for out-of-process consumers)
+
+    # RTSP ingest
+    rtsp_decoder: str = "pyav"  # "pyav" (needs the av extra) or "opencv"
+    rtsp_hwaccel: str = "cuda"  # PyAV hardware decoder ("cuda", "vaapi", ...), "" for CPU
+
+    # MJPEG output
+    jpeg_encoder: str = "turbo"  # "turbo" (libjpeg-turbo), "cpu" (OpenCV), "cuda" (nvJPEG)
+    jpeg_quality: int = 80
+    encode_workers: int = 0  # JPEG encode threads; 0 = half the CPU cores
 
     # YOLO (Layer 2 — not used yet)
     yolo_model: str = "yolo26s.pt"
     yolo_device: str = "mps"
     yolo_confidence: float = 0.5
 
-    model_config = {"env_file": "../.env", "extra": "ignore"}
+
+ENV_FILE = "../.env"
+
+
+def _cast(raw: str, typ: type):
+    """Convert an environment string to the field's declared type."""
+    if typ is bool:
+        return raw.strip().lower() in ("1", "true", "yes", "on")
+    return typ(raw)
 
 
 @lru_cache
 def get_settings() -> Settings:
-    return Settings()
+    # Same precedence as before: process environment wins over the .env file
+    env = {k.upper(): v for k, v in dotenv_values(ENV_FILE).items() if v is not None}
+    env.update((k.upper(), v) for k, v in os.environ.items())
+
+    overrides = {
+        f.name: _cast(env[f.name.upper()], f.type)
+        for f in fields(Settings)
+        if f.name.upper() in env
+    }
+    return Settings(**overrides)
@@ -0,0 +1,139 @@
+"""
+JPEG encoders for the MJPEG stream output.
+
+CpuJpegEncoder:   OpenCV imencode. Always available, the fallback.
+TurboJpegEncoder: libjpeg-turbo via PyTurboJPEG, without OpenCV's wrapper
+                  overhead. The default; needs the system libturbojpeg
+                  (e.g. libturbojpeg0 on Debian/Ubuntu).
+CudaJpegEncoder:  nvJPEG on the GPU via torchvision.io.encode_jpeg.
+                  Needs the `ai` extra (torch + torchvision) and a CUDA device.
+
+All take a BGR uint8 (H, W, 3) image and return JPEG bytes; encode_batch()
+does several images in one call (one batched nvJPEG launch on the GPU).
+`threadsafe` encoders may be called from several threads at once.
+A frame that can't be encoded raises EncodeError, whatever the backend.
+"""
+
+import logging
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger("argus.encode")
+
+
+class EncodeError(ValueError):
+    """A JPEG encode failed (bad input or an encoder/driver error)."""
+
+
+class CpuJpegEncoder:
+    """JPEG encode on the CPU with OpenCV."""
+
+    name = "cpu"
+    threadsafe = True
+
+    def __init__(self, quality: int = 80):
+        self.quality = quality
+        self._params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+
+    def encode(self, image: np.ndarray) -> bytes:
+        try:
+            ok, jpeg = cv2.imencode(".jpg", image, self._params)
+        except cv2.error as e:
+            raise EncodeError(str(e)) from e
+        if not ok:
+            raise EncodeError("JPEG encode failed")
+        return jpeg.tobytes()
+
+    def encode_batch(self, images: list[np.ndarray]) -> list[bytes]:
+        return [self.encode(image) for image in images]
+
+
+class TurboJpegEncoder:
+    """JPEG encode on the CPU with libjpeg-turbo, straight from the BGR array to bytes."""
+
+    name = "turbo"
+    threadsafe = True  # PyTurboJPEG makes a compressor handle per encode() call
+
+    def __init__(self, quality: int = 80):
+        from turbojpeg import TJPF_BGR, TurboJPEG
+
+        self.quality = quality
+        self._tj = TurboJPEG()  # OSError if libturbojpeg isn't installed
+        self._pixel_format = TJPF_BGR
+
+    def encode(self, image: np.ndarray) -> bytes:
+        try:
+            return self._tj.encode(image, quality=self.quality, pixel_format=self._pixel_format)
+        except OSError as e:
+            raise EncodeError(str(e)) from e
+
+    def encode_batch(self, images: list[np.ndarray]) -> list[bytes]:
+        return [self.encode(image) for image in images]
+
+
+class CudaJpegEncoder:
+    """
+    JPEG encode on the GPU with nvJPEG (torchvision).
+
+    Upload, BGR→RGB swizzle, HWC→CHW and the encode itself all run on a
+    dedicated CUDA stream, so they don't serialize behind other GPU work
+    (e.g. Layer 2 inference) on the default stream.
+    """
+
+    name = "cuda"
+    threadsafe = False  # one CUDA stream; batch instead of fanning out
+
+    def __init__(self, quality: int = 80, device: str = "cuda"):
+        import torch
+        from torchvision.io import encode_jpeg
+
+        if not torch.cuda.is_available():
+            raise RuntimeError("CUDA is not available")
+
+        self.quality = quality
+        self._torch = torch
+        self._encode_jpeg = encode_jpeg
+        self._device = torch.device(device)
+        self._stream = torch.cuda.Stream(self._device)
+
+    def encode(self, image: np.ndarray) -> bytes:
+        return self.encode_batch([image])[0]
+
+    def encode_batch(self, images: list[np.ndarray]) -> list[bytes]:
+        """Encode several images (any mix of sizes) with one batched encode_jpeg call."""
+        torch = self._torch
+        try:
+            with torch.cuda.stream(self._stream):
+                chws = [
+                    torch.from_numpy(image).to(self._device, non_blocking=True)
+                    .flip(-1).permute(2, 0, 1).contiguous()  # BGR HWC → RGB CHW
+                    for image in images
+                ]
+                jpegs = self._encode_jpeg(chws, quality=self.quality)
+                # .cpu() waits for this stream's work to finish
+                return [jpeg.cpu().numpy().tobytes() for jpeg in jpegs]
+        except RuntimeError as e:
+            raise EncodeError(str(e)) from e
+
+
+JpegEncoder = CpuJpegEncoder | TurboJpegEncoder | CudaJpegEncoder
+
+_ENCODERS: dict[str, type[JpegEncoder]] = {
+    "cpu": CpuJpegEncoder,
+    "turbo": TurboJpegEncoder,
+    "cuda": CudaJpegEncoder,
+}
+
+
+def make_encoder(kind: str = "turbo", quality: int = 80) -> JpegEncoder:
+    """Build the configured encoder, falling back to OpenCV if it is unusable here."""
+    encoder_cls = _ENCODERS.get(kind)
+    if encoder_cls is None:
+        logger.warning(f"Unknown JPEG encoder '{kind}', using OpenCV")
+    elif encoder_cls is not CpuJpegEncoder:
+        try:
+            return encoder_cls(quality=quality)
+        except (ImportError, OSError, RuntimeError) as e:
+            logger.warning(f"JPEG encoder '{kind}' unavailable ({e}), using OpenCV")
+    return CpuJpegEncoder(quality=quality)
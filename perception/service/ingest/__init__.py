@@ -1,5 +1,6 @@
 from service.ingest.manager import SourceManager, detect_source_type
 from service.ingest.base import SourceAdapter
+from service.ingest.frame_queue import FrameQueue
 from service.ingest.webcam import WebcamAdapter
 from service.ingest.file import FileAdapter
 from service.ingest.rtsp import RTSPAdapter
@@ -8,6 +9,7 @@ from service.ingest.mjpeg import MJPEGAdapter
 __all__ = [
     "SourceManager",
     "SourceAdapter",
+    "FrameQueue",
     "WebcamAdapter",
     "FileAdapter",
     "RTSPAdapter",
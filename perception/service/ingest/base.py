@@ -13,16 +13,40 @@ The adapter handles:
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from datetime import datetime, timezone
+from typing import Callable
 import asyncio
 import time
 import uuid
 import logging
 
-from service.models import Frame, CaptureMeta, SourceStatus, SourceState
+import numpy as np
+
+from service.ingest.frame_queue import FrameQueue
+from service.models import (
+    Frame,
+    FrameBatch,
+    FramePool,
+    SharedFramePool,
+    CaptureMeta,
+    SourceStatus,
+    SourceState,
+)
 
 logger = logging.getLogger("argus.ingest")
 
+# current_fps comes from an EWMA of the frame interval with the smoothing
+# of a ~30-sample moving average
+FPS_SPAN = 30
+FPS_ALPHA = 2.0 / (FPS_SPAN + 1)
+
+# Bound once; read() runs per frame and status() for every source on every tick
+_UTC = timezone.utc
+_fromtimestamp = datetime.fromtimestamp
+_monotonic_ns = time.monotonic_ns
+_time_ns = time.time_ns
+
 
 class SourceAdapter(ABC):
     """
@@ -44,6 +68,8 @@ class SourceAdapter(ABC):
         reconnect_attempts: int = -1,  # -1 = infinite
         reconnect_delay_s: float = 5.0,
         timeout_s: float = 10.0,
+        executor: Executor | None = None,  # for blocking capture calls; None = loop default
+        frame_pool: FramePool | SharedFramePool | None = None,  # image buffers to decode into
     ):
         self.source_id = source_id
         self.name = name
@@ -52,21 +78,37 @@ class SourceAdapter(ABC):
         self.reconnect_attempts = reconnect_attempts
         self.reconnect_delay_s = reconnect_delay_s
         self.timeout_s = timeout_s
+        self._executor = executor
+        self._loop: asyncio.AbstractEventLoop | None = None  # cached in connect()
+        self._frame_pool = frame_pool if frame_pool is not None else FramePool()
 
         # State
-        self._connected = False
+        self._is_connected = False  # via the _connected property
+        self._state_callback: Callable[[bool], None] | None = None
+        self._evict_callback: Callable[[Frame], None] | None = None
         self._running = False
         self._sequence = 0
-        self._connect_time: float | None = None
+        self._connect_ns: int | None = None  # time.monotonic_ns()
 
         # Metrics
         self._frames_total = 0
         self._frames_dropped = 0
         self._reconnect_count = 0
-        self._last_frame_time: float | None = None
-        self._fps_samples: list[float] = []
+        self._last_frame_ns: int | None = None  # time.monotonic_ns()
+        self._last_frame_wall_ns: int | None = None  # time.time_ns()
+        self._last_frame_at: datetime | None = None  # cached from _last_frame_wall_ns
+        self._last_frame_at_ns = 0
         self._last_error: str | None = None
 
+        self._frame_dt_ewma = 0.0  # ns between frames, smoothed
+
+        # Compressed bytes of the frame _read_frame() just returned, for
+        # sources that receive JPEG (see Frame.jpeg). Adapters set it there.
+        self._jpeg: bytes | None = None
+
+        # Frame.release() returns images here for reuse
+        self._release_image: Callable[[np.ndarray], None] | None = self._frame_pool.release
+
     @property
     @abstractmethod
     def protocol(self) -> str:
@@ -83,11 +125,12 @@ class SourceAdapter(ABC):
         ...
 
     @abstractmethod
-    async def _read_frame(self) -> tuple[bool, "np.ndarray | None"]:
+    async def _read_frame(self) -> tuple[bool, np.ndarray | None]:
         """
         Read a single frame from the source.
         Returns (success: bool, image: numpy array or None).
-        Image should be BGR uint8 format.
+        Image should be BGR uint8 format. Sources that received the frame
+        as JPEG may also leave those bytes in self._jpeg.
         """
         ...
 
@@ -96,16 +139,50 @@ class SourceAdapter(ABC):
         """Release all resources for this source."""
         ...
 
+    # ─── Connection State ────────────────────────────────
+
+    @property
+    def _connected(self) -> bool:
+        return self._is_connected
+
+    @_connected.setter
+    def _connected(self, value: bool) -> None:
+        # Connected is exactly ONLINE or DEGRADED, so this is where a source
+        # goes online or offline; tell the listener about real transitions only
+        if value != self._is_connected:
+            self._is_connected = value
+            if self._state_callback is not None:
+                self._state_callback(value)
+
+    def on_state_change(self, callback: Callable[[bool], None] | None) -> None:
+        """Call callback(online) whenever the source goes online or offline."""
+        self._state_callback = callback
+
+    # ─── Drop Accounting ─────────────────────────────────
+
+    def on_evict(self, callback: Callable[[Frame], None] | None) -> None:
+        """
+        Hand frames that our puts evict from the frame queue to callback(frame),
+        which charges the drop to the frame's own source and releases it.
+        Without one, evicted frames are counted as this source's drops.
+        """
+        self._evict_callback = callback
+
+    def record_drop(self) -> None:
+        """Count one of this source's frames as dropped after it was queued."""
+        self._frames_dropped += 1
+
     # ─── Public API ──────────────────────────────────────
 
     async def connect(self) -> bool:
         """Connect to the source with error handling."""
         try:
             logger.info(f"[{self.name}] Connecting to {self.uri}")
+            self._loop = asyncio.get_running_loop()
             success = await self._connect()
             if success:
                 self._connected = True
-                self._connect_time = time.monotonic()
+                self._connect_ns = _monotonic_ns()
                 self._last_error = None
                 logger.info(f"[{self.name}] Connected successfully")
             else:
@@ -132,11 +209,15 @@ class SourceAdapter(ABC):
         """
         Read one frame, wrapped in the Frame dataclass.
         Returns None if read fails.
+
+        The image may be a buffer the adapter reuses for later frames.
+        Call frame.release() once done with it; anything that keeps the
+        pixels beyond that point must copy them.
         """
         if not self._connected:
             return None
 
-        t0 = time.monotonic()
+        t0 = _monotonic_ns()
 
         try:
             success, image = await self._read_frame()
@@ -145,21 +226,24 @@ class SourceAdapter(ABC):
             logger.error(f"[{self.name}] Read error: {e}")
             return None
 
+        jpeg, self._jpeg = self._jpeg, None
+
         if not success or image is None:
             self._frames_dropped += 1
             return None
 
-        elapsed_ms = (time.monotonic() - t0) * 1000
-        now = time.monotonic()
+        now = _monotonic_ns()
+        elapsed_ms = (now - t0) / 1_000_000
 
-        # FPS tracking
-        if self._last_frame_time:
-            dt = now - self._last_frame_time
-            if dt > 0:
-                self._fps_samples.append(1.0 / dt)
-                if len(self._fps_samples) > 30:
-                    self._fps_samples.pop(0)
-        self._last_frame_time = now
+        # FPS tracking: smooth the interval (integer ns, no division per frame)
+        # and invert it only when the rate is read
+        last = self._last_frame_ns
+        if last:
+            dt_ns = now - last
+            ewma = self._frame_dt_ewma or dt_ns  # seeded by the first interval
+            self._frame_dt_ewma = ewma + FPS_ALPHA * (dt_ns - ewma)
+        self._last_frame_ns = now
+        self._last_frame_wall_ns = wall_ns = _time_ns()
 
         self._sequence += 1
         self._frames_total += 1
@@ -170,7 +254,7 @@ class SourceAdapter(ABC):
         return Frame(
             source_id=self.source_id,
             sequence=self._sequence,
-            timestamp=datetime.now(timezone.utc),
+            timestamp_ns=wall_ns,
             image=image,
             width=w,
             height=h,
@@ -181,15 +265,40 @@ class SourceAdapter(ABC):
                 dropped_frames=self._frames_dropped,
                 fps_measured=self.current_fps,
             ),
+            jpeg=jpeg,
+            on_release=self._release_image,
         )
 
-    async def run(self, frame_queue: asyncio.Queue) -> None:
+    async def read_batch(self, n: int) -> FrameBatch | None:
+        """
+        Read up to n frames back-to-back and stack them into a FrameBatch.
+        Stops early on a failed read. Returns None if nothing was read.
+        """
+        frames: list[Frame] = []
+        for _ in range(n):
+            frame = await self.read()
+            if frame is None:
+                break
+            frames.append(frame)
+
+        if not frames:
+            return None
+        return FrameBatch.from_frames(frames)
+
+    async def run(self, frame_queue: FrameQueue) -> None:
         """
         Main capture loop. Reads frames at target_fps and puts them on the queue.
         Handles reconnection on failure.
+
+        Pacing is phase-locked: each tick is scheduled at a fixed offset from
+        the previous deadline, not from when the previous cycle finished, so
+        overshoot does not accumulate. When more than a whole interval behind,
+        the missed ticks are skipped (and counted as dropped) instead of
+        replayed back-to-back.
         """
         self._running = True
-        frame_interval = 1.0 / self.target_fps
+        frame_interval = 1_000_000_000 // self.target_fps  # ns, like the capture timestamps
+        next_tick = _monotonic_ns()
 
         while self._running:
             # Connect if needed
@@ -197,27 +306,35 @@ class SourceAdapter(ABC):
                 success = await self._reconnect()
                 if not success:
                     break  # exhausted reconnect attempts
+                next_tick = _monotonic_ns()
 
             # Capture frame
-            t0 = time.monotonic()
             frame = await self.read()
 
             if frame is not None:
-                try:
-                    # Non-blocking put — drop frame if queue full
-                    frame_queue.put_nowait(frame)
-                except asyncio.QueueFull:
-                    self._frames_dropped += 1
+                # Never blocks — a full queue drops its oldest frame instead
+                evicted = frame_queue.put_nowait(frame)
+                if evicted is not None:
+                    # The queue may be shared, so the frame can be another source's
+                    if self._evict_callback is not None:
+                        self._evict_callback(evicted)
+                    else:
+                        self._frames_dropped += 1
+                        evicted.release()
             else:
                 # Read failed — might need reconnect
                 if not self._connected:
                     continue
 
-            # Throttle to target FPS
-            elapsed = time.monotonic() - t0
-            sleep_time = frame_interval - elapsed
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
+            # Wait for the next deadline, or skip ahead if we fell behind
+            next_tick += frame_interval
+            lag = _monotonic_ns() - next_tick
+            if lag > frame_interval:
+                skipped = lag // frame_interval
+                next_tick += skipped * frame_interval
+                self._frames_dropped += skipped
+            elif lag < 0:
+                await asyncio.sleep(-lag / 1e9)
 
     async def _reconnect(self) -> bool:
         """Attempt to reconnect with backoff."""
@@ -242,35 +359,43 @@ class SourceAdapter(ABC):
 
     @property
     def current_fps(self) -> float:
-        if not self._fps_samples:
-            return 0.0
-        return sum(self._fps_samples) / len(self._fps_samples)
+        dt = self._frame_dt_ewma
+        return 1e9 / dt if dt > 0 else 0.0
 
     @property
     def status(self) -> SourceStatus:
+        fps = self.current_fps
         if not self._connected:
             state = SourceState.ERROR if self._last_error else SourceState.OFFLINE
-        elif self.current_fps < self.target_fps * 0.5:
+        elif fps < self.target_fps * 0.5:
             state = SourceState.DEGRADED
         else:
             state = SourceState.ONLINE
 
+        now = _monotonic_ns()
         uptime = 0.0
-        if self._connect_time:
-            uptime = time.monotonic() - self._connect_time
+        if self._connect_ns:
+            uptime = (now - self._connect_ns) / 1e9
+
+        latency_ms = 0.0
+        if self._last_frame_ns:
+            # Only build a new datetime when a frame arrived since the last call
+            wall_ns = self._last_frame_wall_ns
+            if wall_ns != self._last_frame_at_ns:
+                self._last_frame_at = _fromtimestamp(wall_ns / 1e9, _UTC)
+                self._last_frame_at_ns = wall_ns
+            latency_ms = (now - self._last_frame_ns) / 1_000_000
 
         return SourceStatus(
             source_id=self.source_id,
             state=state,
-            fps_current=self.current_fps,
+            fps_current=round(fps, 1),
             fps_target=float(self.target_fps),
             frames_total=self._frames_total,
             frames_dropped=self._frames_dropped,
-            last_frame_at=datetime.now(timezone.utc) if self._last_frame_time else None,
-            uptime_s=uptime,
+            last_frame_at=self._last_frame_at,
+            uptime_s=round(uptime, 1),
             error=self._last_error,
             reconnect_count=self._reconnect_count,
-            latency_ms=(time.monotonic() - self._last_frame_time) * 1000
-            if self._last_frame_time
-            else 0.0,
+            latency_ms=round(latency_ms, 1),
         )
@@ -8,15 +8,25 @@ Features:
   - Loops by default (for continuous demo)
   - Respects target_fps for playback speed
   - Can serve pre-recorded surveillance footage as realistic demo data
+  - Decodes ahead on a dedicated thread, so the event loop never
+    waits on an executor round-trip per frame
+  - Decodes into pooled buffers: frames handed back via
+    Frame.release() are reused instead of allocating a new image
 """
 
 import asyncio
 import cv2
 import numpy as np
 import os
+import queue
+import threading
 
 from service.ingest.base import SourceAdapter
 
+# Frames decoded ahead of the consumer. Small on purpose: playback is
+# paced by target_fps, we only need enough slack to hide decode jitter.
+DECODE_AHEAD = 2
+
 
 class FileAdapter(SourceAdapter):
     """Adapter for video file playback."""
@@ -24,10 +34,17 @@ class FileAdapter(SourceAdapter):
     def __init__(self, loop_playback: bool = True, **kwargs):
         super().__init__(**kwargs)
         self._cap: cv2.VideoCapture | None = None
-        self._loop = loop_playback
+        self._loop_playback = loop_playback
         self._file_fps: float | None = None
         self._total_frames: int = 0
 
+        # Decode thread → event loop handoff
+        self._frame_buf: queue.Queue = queue.Queue(maxsize=DECODE_AHEAD)
+        self._frame_ready = asyncio.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._buf_shape: tuple[int, int, int] | None = None
+
     @property
     def protocol(self) -> str:
         return "file"
@@ -37,8 +54,13 @@ class FileAdapter(SourceAdapter):
             self._last_error = f"File not found: {self.uri}"
             return False
 
-        loop = asyncio.get_event_loop()
-        self._cap = await loop.run_in_executor(None, cv2.VideoCapture, self.uri)
+        # Reconnecting after end of file — tear down the previous decoder first
+        if self._thread is not None or self._cap is not None:
+            await self._disconnect()
+
+        self._cap = await self._loop.run_in_executor(
+            self._executor, cv2.VideoCapture, self.uri
+        )
 
         if not self._cap.isOpened():
             self._cap = None
@@ -47,31 +69,93 @@ class FileAdapter(SourceAdapter):
         self._file_fps = self._cap.get(cv2.CAP_PROP_FPS)
         self._total_frames = int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT))
 
+        w = int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        h = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self._buf_shape = (h, w, 3) if w > 0 and h > 0 else None
+
+        # Start decoding ahead
+        self._frame_buf = queue.Queue(maxsize=DECODE_AHEAD)
+        self._frame_ready.clear()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._decode_loop,
+            name=f"decode-{self.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
         return True
 
+    def _decode_loop(self) -> None:
+        """
+        Runs on the decode thread. Reads frames into the buffer, blocking
+        when it is full (backpressure). Puts None when playback ends.
+        """
+        # Hot loop: bind everything it touches to locals once. OpenCV drops
+        # the GIL inside read(), so this Python glue is all that contends.
+        cap = self._cap
+        read = cap.read
+        stopped = self._stop.is_set
+        acquire = self._frame_pool.acquire
+        shape = self._buf_shape
+        put = self._put
+        loop_playback = self._loop_playback
+
+        while not stopped():
+            dst = acquire(shape) if shape else None
+            ret, frame = read(dst)
+
+            if not ret or frame is None:
+                if loop_playback:
+                    # Seek back to start
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    ret, frame = read(dst)
+                if not ret or frame is None:
+                    put(None)
+                    return
+
+            if not put(frame):
+                return
+
+    def _put(self, frame: np.ndarray | None) -> bool:
+        """Hand a frame to the event loop. Returns False if stopped while waiting."""
+        while not self._stop.is_set():
+            try:
+                self._frame_buf.put(frame, timeout=0.1)
+            except queue.Full:
+                continue
+            try:
+                self._loop.call_soon_threadsafe(self._frame_ready.set)
+            except RuntimeError:
+                return False  # event loop closed
+            return True
+        return False
+
     async def _read_frame(self) -> tuple[bool, np.ndarray | None]:
         if self._cap is None:
             return False, None
 
-        loop = asyncio.get_event_loop()
-        ret, frame = await loop.run_in_executor(None, self._cap.read)
-
-        if not ret or frame is None:
-            if self._loop:
-                # Seek back to start
-                self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                ret, frame = await loop.run_in_executor(None, self._cap.read)
-                if not ret:
-                    self._connected = False
-                    return False, None
-                return True, frame
-            else:
-                self._connected = False
-                return False, None
+        while True:
+            try:
+                frame = self._frame_buf.get_nowait()
+                break
+            except queue.Empty:
+                # Any put after this point schedules a set() that runs after we await
+                self._frame_ready.clear()
+                await self._frame_ready.wait()
+
+        if frame is None:
+            # End of file (or unrecoverable decode error)
+            self._connected = False
+            return False, None
 
         return True, frame
 
     async def _disconnect(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            await self._loop.run_in_executor(self._executor, self._thread.join)
+            self._thread = None
         if self._cap is not None:
             self._cap.release()
             self._cap = None
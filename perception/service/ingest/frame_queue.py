@@ -0,0 +1,64 @@
+"""
+FrameQueue — The unified queue between the adapters and Layer 2.
+
+Camera frames go stale fast: when the consumer falls behind, the oldest
+frame is the one to lose, not the newest. asyncio.Queue gets that the
+wrong way round (put_nowait refuses the new frame) and pays for futures
+and wakeup bookkeeping on every operation. This is a bounded deque that
+evicts from the head on overflow, plus one Event to park the consumer.
+
+Only used from the event loop thread — not thread-safe.
+"""
+
+import asyncio
+from collections import deque
+
+from service.models import Frame
+
+
+class FrameQueue:
+    """Bounded FIFO of Frames that drops the oldest frame when full."""
+
+    def __init__(self, maxsize: int = 30):
+        # maxsize <= 0 means unbounded, as with asyncio.Queue
+        self._frames: deque[Frame] = deque(maxlen=maxsize if maxsize > 0 else None)
+        self._not_empty = asyncio.Event()
+
+    @property
+    def maxsize(self) -> int:
+        return self._frames.maxlen or 0
+
+    def qsize(self) -> int:
+        return len(self._frames)
+
+    def empty(self) -> bool:
+        return not self._frames
+
+    def full(self) -> bool:
+        return len(self._frames) == self._frames.maxlen
+
+    def put_nowait(self, frame: Frame) -> Frame | None:
+        """
+        Append a frame. Never blocks, never refuses.
+        Returns the frame evicted to make room, if any — the caller owns it
+        (count it as dropped and release it).
+        """
+        frames = self._frames
+        evicted = frames[0] if len(frames) == frames.maxlen else None
+        frames.append(frame)
+        self._not_empty.set()
+        return evicted
+
+    def get_nowait(self) -> Frame:
+        """Pop the oldest frame. Raises asyncio.QueueEmpty if there is none."""
+        if not self._frames:
+            raise asyncio.QueueEmpty
+        return self._frames.popleft()
+
+    async def get(self) -> Frame:
+        """Pop the oldest frame, waiting for one if the queue is empty."""
+        frames = self._frames
+        while not frames:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return frames.popleft()
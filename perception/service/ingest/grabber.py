@@ -0,0 +1,113 @@
+"""
+FrameGrabber — Keeps the most recent frame of a live source on a background thread.
+
+Live sources (USB, RTSP, MJPEG) should always deliver the newest frame, never
+a backlog. The grabber thread reads continuously (OpenCV releases the GIL
+while it blocks in read()), overwrites a single "latest" slot, and wakes the
+event loop. Frames nobody picked up are simply replaced — the same policy as
+CAP_PROP_BUFFERSIZE=1, without an executor round-trip per frame.
+
+Frames are decoded into buffers from the adapter's FramePool; a frame that
+gets replaced before anyone took it goes straight back to the pool.
+
+Sources that receive JPEG on the wire (MJPEG) can also hand over the
+compressed bytes, which travel with the frame so nobody has to re-encode it.
+
+FileAdapter does not use this: file playback must not skip frames, so it
+decodes ahead into a bounded queue instead.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Callable
+
+import numpy as np
+
+from service.models import FramePool, SharedFramePool
+
+logger = logging.getLogger("argus.ingest")
+
+
+class FrameGrabber:
+    """Reads frames on a daemon thread and hands the latest one to the event loop."""
+
+    def __init__(
+        self,
+        read: Callable[..., tuple],
+        loop: asyncio.AbstractEventLoop,
+        name: str,
+        pool: FramePool | SharedFramePool,
+    ):
+        # read(dst) -> (ok, image) like VideoCapture.read, or (ok, image, jpeg)
+        # when the source also has the frame as JPEG
+        self._read = read
+        self._name = name
+        self._loop = loop
+        self._pool = pool
+        self._lock = threading.Lock()
+        self._slot: tuple[bool, np.ndarray | None, bytes | None] | None = None
+        self._ready = asyncio.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"grab-{name}", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Ask the thread to exit and wait for it. Blocks for up to one read()."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _run(self) -> None:
+        read = self._read
+        stopped = self._stop.is_set
+        lock = self._lock
+        signal = self._ready.set
+        acquire = self._pool.acquire
+        release = self._pool.release
+        shape = None  # learned from the first frame
+
+        while not stopped():
+            dst = acquire(shape) if shape else None
+            try:
+                ret, frame, *jpeg = read(dst)
+            except Exception as e:
+                # Treated like a failed read: the slot below wakes the adapter,
+                # which sees the failure and reconnects
+                logger.error(f"[{self._name}] Read error: {e}")
+                ret, frame, jpeg = False, None, []
+            ok = bool(ret) and frame is not None
+            if ok:
+                shape = frame.shape
+            if dst is not None and (not ok or frame is not dst):
+                release(dst)  # read() didn't decode into it
+
+            with lock:
+                stale, self._slot = self._slot, (
+                    (True, frame, jpeg[0] if jpeg else None) if ok else (False, None, None)
+                )
+            if stale is not None and stale[1] is not None:
+                release(stale[1])  # nobody took it
+            try:
+                self._loop.call_soon_threadsafe(signal)
+            except RuntimeError:
+                return  # event loop closed
+
+            if not ok:
+                return  # stream ended or broke; the adapter reconnects
+
+    async def latest(self) -> tuple[bool, np.ndarray | None, bytes | None]:
+        """
+        Wait for a frame newer than the last one returned, then take it.
+        Returns (ok, image, jpeg); jpeg is None unless the source provided it.
+        """
+        while True:
+            with self._lock:
+                slot, self._slot = self._slot, None
+            if slot is not None:
+                return slot
+            # A frame stored after this point schedules a set() that runs after we await
+            self._ready.clear()
+            await self._ready.wait()
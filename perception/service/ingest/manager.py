@@ -11,11 +11,15 @@ Responsibilities:
 
 import asyncio
 import logging
+import re
 import uuid
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
-from service.models import Frame, SourceStatus, SourceState
+from service.models import Frame, FramePool, SharedFramePool, SourceStatus
 from service.ingest.base import SourceAdapter
+from service.ingest.frame_queue import FrameQueue
 from service.ingest.webcam import WebcamAdapter
 from service.ingest.file import FileAdapter
 from service.ingest.rtsp import RTSPAdapter
@@ -34,24 +38,21 @@ ADAPTER_MAP: dict[str, type[SourceAdapter]] = {
 }
 
 
+# One anchored, case-insensitive match; the group that matched is the type.
+_DETECT_RE = re.compile(
+    r"\s*(?:(?P<rtsp>rtsps?://)|(?P<mjpeg>https?://)|(?P<usb>/dev/video|\d+\s*$))",
+    re.IGNORECASE,
+)
+
+
 def detect_source_type(uri: str) -> str:
-    """Auto-detect source type from URI."""
-    uri_lower = uri.strip().lower()
-
-    if uri_lower.startswith("rtsp://"):
-        return "rtsp"
-    elif uri_lower.startswith("http://") or uri_lower.startswith("https://"):
-        # Check if it looks like an MJPEG stream
-        if any(ext in uri_lower for ext in [".mjpg", ".mjpeg", "mjpeg", "/video"]):
-            return "mjpeg"
-        return "mjpeg"  # Default HTTP to MJPEG
-    elif uri_lower.isdigit() or uri_lower.startswith("/dev/video"):
-        return "usb"
-    elif any(uri_lower.endswith(ext) for ext in [".mp4", ".avi", ".mkv", ".mov", ".webm"]):
-        return "file"
-    else:
-        # Try as file path
-        return "file"
+    """
+    Auto-detect source type from URI: rtsp(s):// → rtsp, http(s):// → mjpeg
+    (HTTP sources are treated as MJPEG streams), /dev/video* or a bare device
+    index → usb. Anything unrecognized is treated as a file path.
+    """
+    m = _DETECT_RE.match(uri)
+    return m.lastgroup if m is not None else "file"
 
 
 class SourceManager:
@@ -61,12 +62,24 @@ class SourceManager:
         settings = get_settings()
         self._adapters: dict[uuid.UUID, SourceAdapter] = {}
         self._tasks: dict[uuid.UUID, asyncio.Task] = {}
-        self._frame_queue = asyncio.Queue(maxsize=frame_queue_size)
+        self._online: set[uuid.UUID] = set()  # kept up to date by the adapters
+        self._frame_queue = FrameQueue(maxsize=frame_queue_size)
         self._running = False
 
+        # Blocking OpenCV calls from every adapter run here, sized to the
+        # source limit, instead of competing for the loop's default executor
+        self._decode_pool = ThreadPoolExecutor(
+            max_workers=settings.max_sources,
+            thread_name_prefix="decode",
+        )
+        # Image buffers shared by all adapters, returned by Frame.release()
+        self._frame_pool: FramePool | SharedFramePool = (
+            SharedFramePool() if settings.frame_pool == "shared" else FramePool()
+        )
+
     @property
-    def frame_queue(self) -> asyncio.Queue:
-        """The unified frame queue that Layer 2 consumes from."""
+    def frame_queue(self) -> FrameQueue:
+        """The unified frame queue that Layer 2 consumes from. Drops the oldest frame when full."""
         return self._frame_queue
 
     def _create_adapter(
@@ -94,6 +107,8 @@ class SourceManager:
             reconnect_attempts=reconnect_attempts,
             reconnect_delay_s=reconnect_delay_s,
             timeout_s=timeout_s,
+            executor=self._decode_pool,
+            frame_pool=self._frame_pool,
             **kwargs,
         )
 
@@ -136,6 +151,8 @@ class SourceManager:
             return False
 
         self._adapters[source_id] = adapter
+        adapter.on_state_change(partial(self._set_online, source_id))
+        adapter.on_evict(self._evicted)
 
         # Start capture task
         task = asyncio.create_task(
@@ -156,6 +173,9 @@ class SourceManager:
             return False
 
         await adapter.disconnect()
+        adapter.on_state_change(None)
+        adapter.on_evict(None)
+        self._online.discard(source_id)
         if task and not task.done():
             task.cancel()
             try:
@@ -175,17 +195,32 @@ class SourceManager:
         """Get status of all sources."""
         return {sid: adapter.status for sid, adapter in self._adapters.items()}
 
+    def has_source(self, source_id: uuid.UUID) -> bool:
+        """Whether the source is added (not necessarily connected)."""
+        return source_id in self._adapters
+
     @property
     def source_count(self) -> int:
         return len(self._adapters)
 
+    def _set_online(self, source_id: uuid.UUID, online: bool) -> None:
+        if online:
+            self._online.add(source_id)
+        else:
+            self._online.discard(source_id)
+
+    def _evicted(self, frame: Frame) -> None:
+        # The queue is shared: charge the drop to the source that lost the
+        # frame, not to the adapter whose put made room
+        owner = self._adapters.get(frame.source_id)
+        if owner is not None:
+            owner.record_drop()
+        frame.release()
+
     @property
     def online_count(self) -> int:
-        return sum(
-            1
-            for a in self._adapters.values()
-            if a.status.state in (SourceState.ONLINE, SourceState.DEGRADED)
-        )
+        """Sources that are ONLINE or DEGRADED, i.e. connected."""
+        return len(self._online)
 
     async def stop_all(self) -> None:
         """Stop all sources gracefully."""
@@ -194,3 +229,9 @@ class SourceManager:
         for sid in source_ids:
             await self.remove_source(sid)
         logger.info("All sources stopped")
+
+    async def shutdown(self) -> None:
+        """Stop all sources and join the decode pool. The manager is unusable afterwards."""
+        await self.stop_all()
+        await asyncio.to_thread(self._decode_pool.shutdown, wait=True)
+        self._frame_pool.close()
@@ -4,14 +4,133 @@ MJPEGAdapter — Captures frames from HTTP MJPEG streams.
 URI format: "http://192.168.1.100:8080/mjpeg" or "http://cam:8080/video.mjpg"
 
 Many budget cameras and some phone apps (IP Webcam for Android)
-expose MJPEG over HTTP. OpenCV handles this natively.
+expose MJPEG over HTTP. The stream is already a sequence of JPEGs, so
+the adapter reads the multipart response itself and keeps each part's
+bytes on the Frame (Frame.jpeg): the MJPEG output serves them as-is
+instead of decoding and re-encoding every frame. Responses that aren't
+multipart fall back to OpenCV.
 """
 
-import asyncio
+import base64
+import http.client
+import urllib.parse
+import urllib.request
+
 import cv2
 import numpy as np
 
 from service.ingest.base import SourceAdapter
+from service.ingest.grabber import FrameGrabber
+
+
+class MultipartJpegReader:
+    """
+    Blocking reader for a multipart/x-mixed-replace JPEG stream.
+    read() has the (ok, image, jpeg) shape FrameGrabber expects.
+    """
+
+    def __init__(self, response: http.client.HTTPResponse, boundary: bytes):
+        self._resp = response
+        self._boundary = boundary.lstrip(b"-")
+        self._pending: bytes | None = None  # boundary line read while scanning a body
+
+    @classmethod
+    def open(cls, uri: str, timeout: float) -> "MultipartJpegReader | None":
+        """
+        Open the stream. Returns None if the server doesn't answer with
+        multipart (e.g. a snapshot URL), so the caller can try OpenCV instead.
+        """
+        parts = urllib.parse.urlsplit(uri)
+        headers = {}
+        if parts.username:
+            # urllib won't send credentials embedded in the URL by itself
+            user = urllib.parse.unquote(parts.username)
+            password = urllib.parse.unquote(parts.password or "")
+            creds = f"{user}:{password}"
+            headers["Authorization"] = "Basic " + base64.b64encode(creds.encode()).decode()
+            # Keep host[:port] exactly as written (IPv6 brackets included)
+            parts = parts._replace(netloc=parts.netloc.rpartition("@")[2])
+
+        req = urllib.request.Request(urllib.parse.urlunsplit(parts), headers=headers)
+        resp = urllib.request.urlopen(req, timeout=timeout)
+
+        msg = resp.headers
+        boundary = msg.get_param("boundary")
+        if msg.get_content_maintype() != "multipart" or not boundary:
+            resp.close()
+            return None
+        return cls(resp, boundary.encode())
+
+    def _readline(self) -> bytes:
+        if self._pending is not None:
+            line, self._pending = self._pending, None
+            return line
+        return self._resp.readline()
+
+    def _next_part(self) -> bytes | None:
+        """Body of the next JPEG part, or None at end of stream."""
+        readline = self._readline
+        boundary = self._boundary
+
+        # Skip to the part headers
+        while True:
+            line = readline()
+            if not line:
+                return None
+            delimiter = line.strip().lstrip(b"-")
+            if delimiter == boundary:
+                break
+            if delimiter == boundary + b"--":
+                return None  # closing delimiter: no more parts
+
+        length = None
+        while True:
+            line = readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                length = int(value)
+
+        if length is not None:
+            data = self._resp.read(length)
+            return data if len(data) == length else None
+
+        # No Content-Length: the body runs until the next boundary line, or
+        # the closing "--boundary--" after the last part. It is kept for the
+        # next call, which ends the stream on the closing delimiter.
+        delimiters = (boundary, boundary + b"--")
+        chunks = []
+        while True:
+            line = readline()
+            if not line:
+                return None
+            if line.startswith(b"--") and line.strip().lstrip(b"-") in delimiters:
+                self._pending = line
+                break
+            chunks.append(line)
+        data = b"".join(chunks)
+        return data[:-2] if data.endswith(b"\r\n") else data
+
+    def read(self, dst: np.ndarray | None = None) -> tuple[bool, np.ndarray | None, bytes | None]:
+        # dst is unused: imdecode always allocates
+        try:
+            jpeg = self._next_part()
+        except (OSError, ValueError, http.client.HTTPException):
+            return False, None, None
+        if not jpeg:
+            return False, None, None
+
+        image = cv2.imdecode(np.frombuffer(jpeg, np.uint8), cv2.IMREAD_COLOR)
+        if image is None:
+            return False, None, None
+        return True, image, jpeg
+
+    def close(self) -> None:
+        self._resp.close()
 
 
 class MJPEGAdapter(SourceAdapter):
@@ -19,28 +138,44 @@ class MJPEGAdapter(SourceAdapter):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._cap: cv2.VideoCapture | None = None
+        self._reader: MultipartJpegReader | None = None
+        self._cap: cv2.VideoCapture | None = None  # fallback for non-multipart responses
+        self._grabber: FrameGrabber | None = None
 
     @property
     def protocol(self) -> str:
         return "mjpeg"
 
     async def _connect(self) -> bool:
-        loop = asyncio.get_event_loop()
-        self._cap = await loop.run_in_executor(None, cv2.VideoCapture, self.uri)
-
-        if not self._cap.isOpened():
-            self._cap = None
-            return False
+        # Reconnecting — tear down the previous capture first
+        if self._grabber is not None or self._reader is not None or self._cap is not None:
+            await self._disconnect()
+
+        self._reader = await self._loop.run_in_executor(
+            self._executor, MultipartJpegReader.open, self.uri, self.timeout_s
+        )
+
+        if self._reader is not None:
+            read = self._reader.read
+        else:
+            self._cap = await self._loop.run_in_executor(self._executor, cv2.VideoCapture, self.uri)
+            if not self._cap.isOpened():
+                self._cap = None
+                return False
+            read = self._cap.read
+
+        self._grabber = FrameGrabber(
+            read, self._loop, self.name, self._frame_pool
+        )
+        self._grabber.start()
 
         return True
 
     async def _read_frame(self) -> tuple[bool, np.ndarray | None]:
-        if self._cap is None:
+        if self._grabber is None:
             return False, None
 
-        loop = asyncio.get_event_loop()
-        ret, frame = await loop.run_in_executor(None, self._cap.read)
+        ret, frame, self._jpeg = await self._grabber.latest()
 
         if not ret or frame is None:
             self._connected = False
@@ -49,6 +184,12 @@ class MJPEGAdapter(SourceAdapter):
         return True, frame
 
     async def _disconnect(self) -> None:
+        if self._grabber is not None:
+            await self._loop.run_in_executor(self._executor, self._grabber.stop)
+            self._grabber = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
         if self._cap is not None:
             self._cap.release()
             self._cap = None
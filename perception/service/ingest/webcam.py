@@ -4,12 +4,12 @@ WebcamAdapter — Captures frames from USB/UVC cameras (built-in webcam, externa
 URI format: "0" or "1" (device index) or "/dev/video0" (Linux device path)
 """
 
-import asyncio
 import cv2
 import numpy as np
 import uuid
 
 from service.ingest.base import SourceAdapter
+from service.ingest.grabber import FrameGrabber
 
 
 class WebcamAdapter(SourceAdapter):
@@ -18,6 +18,7 @@ class WebcamAdapter(SourceAdapter):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._cap: cv2.VideoCapture | None = None
+        self._grabber: FrameGrabber | None = None
         self._device_index = self._parse_device(self.uri)
 
     @property
@@ -38,10 +39,13 @@ class WebcamAdapter(SourceAdapter):
             return 0
 
     async def _connect(self) -> bool:
+        # Reconnecting — tear down the previous capture first
+        if self._grabber is not None or self._cap is not None:
+            await self._disconnect()
+
         # OpenCV VideoCapture is blocking, run in thread
-        loop = asyncio.get_event_loop()
-        self._cap = await loop.run_in_executor(
-            None, cv2.VideoCapture, self._device_index
+        self._cap = await self._loop.run_in_executor(
+            self._executor, cv2.VideoCapture, self._device_index
         )
         if not self._cap.isOpened():
             self._cap = None
@@ -49,14 +53,18 @@ class WebcamAdapter(SourceAdapter):
 
         # Try to set resolution if specified
         # (OpenCV respects these as hints, camera may ignore)
+
+        self._grabber = FrameGrabber(
+            self._cap.read, self._loop, self.name, self._frame_pool
+        )
+        self._grabber.start()
         return True
 
     async def _read_frame(self) -> tuple[bool, np.ndarray | None]:
-        if self._cap is None:
+        if self._grabber is None:
             return False, None
 
-        loop = asyncio.get_event_loop()
-        ret, frame = await loop.run_in_executor(None, self._cap.read)
+        ret, frame, _ = await self._grabber.latest()
 
         if not ret or frame is None:
             self._connected = False
@@ -65,6 +73,9 @@ class WebcamAdapter(SourceAdapter):
         return True, frame
 
     async def _disconnect(self) -> None:
+        if self._grabber is not None:
+            await self._loop.run_in_executor(self._executor, self._grabber.stop)
+            self._grabber = None
         if self._cap is not None:
             self._cap.release()
             self._cap = None
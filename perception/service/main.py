@@ -11,19 +11,27 @@ Runs as a separate process from the Backend API.
 Communicates via Redis pub/sub and shared PostgreSQL.
 """
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 import asyncio
-import cv2
+import itertools
 import json
 import logging
+import os
+import time
 import uuid
 
+import msgspec
+
 from service.config import get_settings
+from service.encode import EncodeError, make_encoder
 from service.ingest.manager import SourceManager
+from service.models import Frame
 
 # ─── Logging ─────────────────────────────────────────────
 
@@ -38,36 +46,158 @@ logger = logging.getLogger("argus.perception")
 
 settings = get_settings()
 source_manager = SourceManager(frame_queue_size=settings.frame_queue_size)
+jpeg_encoder = make_encoder(settings.jpeg_encoder, settings.jpeg_quality)
+
+# JPEG encode runs here, not on the event loop. Each round's frames are split
+# across the workers, which encode in parallel (the encoders release the GIL).
+# The nvJPEG encoder gets one worker: its win is one batched launch per round.
+ENCODE_WORKERS = (
+    (settings.encode_workers or max(1, (os.cpu_count() or 1) // 2))
+    if jpeg_encoder.threadsafe
+    else 1
+)
+encode_pool = ThreadPoolExecutor(max_workers=ENCODE_WORKERS, thread_name_prefix="encode")
 
 # Store latest frame per source for MJPEG streaming
 latest_frames: dict[uuid.UUID, bytes] = {}  # source_id → JPEG bytes
 
+# The same frame as a complete multipart part, built once per frame and
+# yielded as-is to every viewer of the source
+latest_mjpeg_parts: dict[uuid.UUID, bytes] = {}  # source_id → part bytes
+
+# Part header; the CRLF that ends the previous part's body leads it
+MJPEG_PART_HEADER = b"\r\n--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n"
+
+# Pulsed (set + clear) whenever a source's entry in latest_frames changes,
+# waking the MJPEG viewers of that source. These three dicts are only written
+# for sources the manager still has, so stop_source's cleanup sticks.
+frame_events: defaultdict[uuid.UUID, asyncio.Event] = defaultdict(asyncio.Event)
+
 # Task that reads from frame queue and updates latest_frames
 frame_distributor_task: asyncio.Task | None = None
 
 
+# Distributor error handling: back off 1 ms, 2 ms, 4 ms ... up to 1 s while
+# rounds keep failing, and log at most one line per interval
+ERROR_BACKOFF_MAX_S = 1.0
+ERROR_LOG_INTERVAL_S = 5.0
+
+
+def _encode_each(encode, images: list) -> list:
+    """encode() the images one by one; a failed image gets its EncodeError instead of bytes."""
+    jpegs = []
+    for image in images:
+        try:
+            jpegs.append(encode(image))
+        except EncodeError as e:
+            jpegs.append(e)
+    return jpegs
+
+
+def _encode_chunk(images: list) -> list:
+    """encode_batch() the images; if one of them fails, fall back to _encode_each()."""
+    try:
+        return jpeg_encoder.encode_batch(images)
+    except EncodeError:
+        # A bad frame fails the whole batch — redo it per frame
+        return _encode_each(jpeg_encoder.encode, images)
+
+
 async def frame_distributor():
     """
     Reads frames from the unified queue and:
     1. Stores latest JPEG for MJPEG streaming
     2. (Future) Feeds frames to Layer 2 AI pipeline
+
+    Everything queued is taken at once. Only the newest frame of each source
+    is worth a JPEG, and those are split into one encode_batch call per
+    encode worker (a single batched launch with the nvJPEG encoder). If a
+    frame can't be encoded, its chunk is redone one frame at a time so only
+    that source misses this round.
     """
     logger.info("Frame distributor started")
+    loop = asyncio.get_running_loop()
+    queue = source_manager.frame_queue
+
+    failures = 0  # consecutive failed rounds
+    unlogged = 0  # errors since the last one logged
+    last_log = float("-inf")
+
+    def report(error: Exception, trace: bool) -> None:
+        nonlocal unlogged, last_log
+        now = time.monotonic()
+        if now - last_log >= ERROR_LOG_INTERVAL_S:
+            more = f" (+{unlogged} more since last report)" if unlogged else ""
+            logger.error(
+                f"Frame distributor error: {error}{more}", exc_info=error if trace else None
+            )
+            last_log, unlogged = now, 0
+        else:
+            unlogged += 1
+
     while True:
+        newest: dict[uuid.UUID, Frame] = {}
         try:
-            frame = await source_manager.frame_queue.get()
-
-            # Encode frame as JPEG for MJPEG streaming
-            _, jpeg = cv2.imencode(
-                ".jpg", frame.image, [cv2.IMWRITE_JPEG_QUALITY, 80]
-            )
-            latest_frames[frame.source_id] = jpeg.tobytes()
+            frame = await queue.get()
+            while True:
+                older = newest.get(frame.source_id)
+                if older is not None:
+                    older.release()  # superseded before it was shown
+                newest[frame.source_id] = frame
+                if queue.empty():
+                    break
+                frame = queue.get_nowait()
+
+            ready: list[tuple[uuid.UUID, bytes]] = []
+            to_encode: list[Frame] = []
+            for frame in newest.values():
+                if frame.jpeg is not None:
+                    # Source already sent JPEG (MJPEG) — serve it as-is
+                    ready.append((frame.source_id, frame.jpeg))
+                else:
+                    to_encode.append(frame)
+
+            if to_encode:
+                # Encode as JPEG for MJPEG streaming, one contiguous chunk per worker
+                images = [f.image for f in to_encode]
+                size = -(-len(images) // ENCODE_WORKERS)  # ceil
+                chunks = await asyncio.gather(*(
+                    loop.run_in_executor(encode_pool, _encode_chunk, images[i:i + size])
+                    for i in range(0, len(images), size)
+                ))
+                jpegs = itertools.chain.from_iterable(chunks)
+                for frame, jpeg in zip(to_encode, jpegs):
+                    if isinstance(jpeg, EncodeError):
+                        report(jpeg, trace=False)  # skip it; the source keeps its last JPEG
+                        continue
+                    ready.append((frame.source_id, jpeg))
+
+            has_source = source_manager.has_source
+            for source_id, jpeg in ready:
+                if not has_source(source_id):
+                    continue  # stopped while its frame was queued or encoding
+                latest_frames[source_id] = jpeg
+                latest_mjpeg_parts[source_id] = MJPEG_PART_HEADER % len(jpeg) + jpeg
+
+                # Wake this source's viewers; set() alone already woke the current waiters
+                event = frame_events[source_id]
+                event.set()
+                event.clear()
+
+            failures = 0
+            continue
 
         except asyncio.CancelledError:
             break
         except Exception as e:
-            logger.error(f"Frame distributor error: {e}")
-            await asyncio.sleep(0.01)
+            error = e  # not a bad frame — keep the traceback
+        finally:
+            for frame in newest.values():
+                frame.release()
+
+        failures += 1
+        report(error, trace=True)
+        await asyncio.sleep(min(0.001 * 2 ** min(failures, 10), ERROR_BACKOFF_MAX_S))
 
 
 # ─── App Lifecycle ───────────────────────────────────────
@@ -83,6 +213,8 @@ async def lifespan(app: FastAPI):
     # Start frame distributor
     frame_distributor_task = asyncio.create_task(frame_distributor())
     print("  ✓ Frame distributor started")
+    print(f"  ✓ JPEG encoder: {jpeg_encoder.name}")
+    print(f"  ✓ Event loop: {type(asyncio.get_running_loop()).__module__}")
     print(f"  ✓ Server on {settings.perception_host}:{settings.perception_port}")
     print("=" * 50)
 
@@ -90,13 +222,14 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down perception service...")
-    await source_manager.stop_all()
+    await source_manager.shutdown()
     if frame_distributor_task:
         frame_distributor_task.cancel()
         try:
             await frame_distributor_task
         except asyncio.CancelledError:
             pass
+    await asyncio.to_thread(encode_pool.shutdown)
 
 
 app = FastAPI(
@@ -163,20 +296,33 @@ async def stop_source(source_id: uuid.UUID):
     success = await source_manager.remove_source(source_id)
     if not success:
         raise HTTPException(status_code=404, detail="Source not found")
-    # Clean up cached frame
+    # Clean up cached frame, and let open streams see the source is gone
     latest_frames.pop(source_id, None)
+    latest_mjpeg_parts.pop(source_id, None)
+    event = frame_events.pop(source_id, None)
+    if event is not None:
+        event.set()
     return {"status": "stopped", "source_id": str(source_id)}
 
 
-@app.get("/sources/status")
-async def all_source_status():
-    """Get status of all active sources."""
+_json_encode = msgspec.json.Encoder().encode
+
+
+def _status_payload(**extra) -> bytes:
+    """All source statuses as JSON, encoded by msgspec straight from the Structs."""
     statuses = source_manager.get_all_status()
-    return {
+    return _json_encode({
+        **extra,
         "total": source_manager.source_count,
         "online": source_manager.online_count,
-        "sources": {str(sid): s.to_dict() for sid, s in statuses.items()},
-    }
+        "sources": {str(sid): s for sid, s in statuses.items()},
+    })
+
+
+@app.get("/sources/status")
+async def all_source_status():
+    """Get status of all active sources."""
+    return Response(_status_payload(), media_type="application/json")
 
 
 @app.get("/sources/{source_id}/status")
@@ -185,23 +331,31 @@ async def source_status(source_id: uuid.UUID):
     status = source_manager.get_status(source_id)
     if status is None:
         raise HTTPException(status_code=404, detail="Source not found")
-    return status.to_dict()
+    return Response(_json_encode(status), media_type="application/json")
 
 
 # ─── MJPEG Streaming ────────────────────────────────────
 
 async def mjpeg_generator(source_id: uuid.UUID):
-    """Generate MJPEG stream from latest frames."""
-    target_interval = 1.0 / 15  # 15 FPS for stream output
+    """
+    Generate MJPEG stream from latest frames.
 
-    while True:
-        jpeg_bytes = latest_frames.get(source_id)
-        if jpeg_bytes:
-            yield (
-                b"--frame\r\n"
-                b"Content-Type: image/jpeg\r\n\r\n" + jpeg_bytes + b"\r\n"
-            )
-        await asyncio.sleep(target_interval)
+    Sends a part each time the source delivers a frame (so the stream runs
+    at the source's target_fps) and ends when the source is stopped.
+    Parts come prebuilt from latest_mjpeg_parts: one write per frame, and
+    every viewer shares the same bytes object.
+    """
+    has_source = source_manager.has_source
+    sent = None
+    # Checked after every send and wake. Between the check and wait() nothing
+    # yields, so a stop can't slip in and leave us on an event nobody sets.
+    while has_source(source_id):
+        part = latest_mjpeg_parts.get(source_id)
+        if part is not None and part is not sent:
+            yield part
+            sent = part
+            continue
+        await frame_events[source_id].wait()
 
 
 @app.get("/stream/{source_id}")
@@ -215,7 +369,7 @@ async def video_stream(source_id: uuid.UUID):
     This is the simplest way to get live video into any web UI.
     No WebSocket complexity, works in any <img> tag.
     """
-    if source_id not in source_manager._adapters:
+    if not source_manager.has_source(source_id):
         raise HTTPException(status_code=404, detail="Source not found or not started")
 
     return StreamingResponse(
@@ -237,14 +391,8 @@ async def status_websocket(websocket: WebSocket):
 
     try:
         while True:
-            statuses = source_manager.get_all_status()
-            payload = {
-                "type": "source_status",
-                "total": source_manager.source_count,
-                "online": source_manager.online_count,
-                "sources": {str(sid): s.to_dict() for sid, s in statuses.items()},
-            }
-            await websocket.send_json(payload)
+            # Text frame: the frontend JSON.parses event.data
+            await websocket.send_text(_status_payload(type="source_status").decode())
             await asyncio.sleep(2)
     except WebSocketDisconnect:
         logger.info("Status WebSocket disconnected")
@@ -2,15 +2,26 @@
 Core data models for the perception pipeline.
 
 Frame: The unit of data flowing from Layer 1 (Ingest) to Layer 2 (Perceive).
+FrameBatch: Several Frames stacked into arrays, for batched Layer 2 consumers.
+FramePool: Reusable image buffers shared by adapters and frame consumers.
+SharedFramePool: The same, backed by shared memory for out-of-process consumers.
 SourceStatus: Health/state of each camera source.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable
+import msgspec
 import numpy as np
+import sys
+import threading
 import uuid
 
+_UTC = timezone.utc
+
 
 class SourceState(str, Enum):
     CONNECTING = "connecting"
@@ -20,7 +31,7 @@ class SourceState(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class CaptureMeta:
     """Metadata about how the frame was captured."""
     protocol: str             # rtsp, usb, file, mjpeg, screen
@@ -30,7 +41,7 @@ class CaptureMeta:
     fps_measured: float = 0.0  # actual FPS being achieved
 
 
-@dataclass
+@dataclass(slots=True)
 class Frame:
     """
     The fundamental unit flowing between Layer 1 and Layer 2.
@@ -40,21 +51,211 @@ class Frame:
     """
     source_id: uuid.UUID
     sequence: int              # monotonic counter per source
-    timestamp: datetime        # capture time, UTC
+    timestamp_ns: int          # capture time, ns since epoch (time.time_ns)
     image: np.ndarray          # raw pixels, BGR, uint8, shape (H, W, 3)
     width: int
     height: int
     channels: int = 3
     capture_meta: CaptureMeta = field(default_factory=lambda: CaptureMeta(protocol="unknown"))
+    # The frame as the source sent it, when that was already JPEG (MJPEG)
+    jpeg: bytes | None = field(default=None, repr=False, compare=False)
+    # Set when `image` is a reusable buffer owned by the adapter
+    on_release: Callable[[np.ndarray], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    def release(self) -> None:
+        """
+        Hand the image buffer back to the adapter for reuse.
+        `image` must not be touched after this; copy it first if needed.
+        Safe to call more than once.
+        """
+        if self.on_release is not None:
+            on_release, self.on_release = self.on_release, None
+            on_release(self.image)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Capture time as a UTC datetime, built only when asked for."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, _UTC)
 
     @property
     def shape(self) -> tuple[int, int, int]:
         return (self.height, self.width, self.channels)
 
 
-@dataclass
-class SourceStatus:
-    """Real-time health status of a source adapter."""
+@dataclass(slots=True)
+class FrameBatch:
+    """
+    Structure-of-arrays view of several Frames.
+
+    Lets Layer 2 run one batched call over `images` (e.g. `model(batch.images)`)
+    and vectorize over the per-frame metadata instead of walking Frame objects.
+    """
+    source_ids: list[uuid.UUID]
+    sequences: np.ndarray      # int64, (N,)
+    timestamps_ns: np.ndarray  # int64, (N,)
+    latencies_ms: np.ndarray   # float64, (N,)
+    images: np.ndarray         # uint8, (N, H, W, C)
+
+    def __len__(self) -> int:
+        return len(self.source_ids)
+
+    @classmethod
+    def from_frames(cls, frames: list[Frame]) -> "FrameBatch":
+        """
+        Stack frames of identical shape into a batch.
+        The pixels are copied, so each frame's buffer is released afterwards.
+        """
+        if not frames:
+            raise ValueError("Cannot build a FrameBatch from no frames")
+        shape = frames[0].image.shape
+        if any(f.image.shape != shape for f in frames):
+            raise ValueError("All frames in a batch must have the same shape")
+
+        batch = cls(
+            source_ids=[f.source_id for f in frames],
+            sequences=np.fromiter((f.sequence for f in frames), np.int64, len(frames)),
+            timestamps_ns=np.fromiter((f.timestamp_ns for f in frames), np.int64, len(frames)),
+            latencies_ms=np.fromiter(
+                (f.capture_meta.latency_ms for f in frames), np.float64, len(frames)
+            ),
+            images=np.stack([f.image for f in frames]),
+        )
+        for f in frames:
+            f.release()
+        return batch
+
+
+class FramePool:
+    """
+    Recycles HxWxC uint8 image buffers instead of allocating one per frame.
+
+    Decode threads `acquire()` a buffer to read into; `Frame.release()` hands
+    it back through `release()` once the consumer is done. Free buffers are
+    kept per shape, at most `max_free` of each. Thread-safe.
+    """
+
+    def __init__(self, max_free: int = 8):
+        self.max_free = max_free
+        self._free: dict[tuple[int, ...], list[np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, shape: tuple[int, ...]) -> np.ndarray:
+        """A free buffer of this shape, or a new one if none are free."""
+        with self._lock:
+            free = self._free.get(shape)
+            if free:
+                return free.pop()
+        return np.empty(shape, dtype=np.uint8)
+
+    def release(self, image: np.ndarray) -> None:
+        """Take a buffer back. Anything that isn't a plain contiguous uint8 array is ignored."""
+        if image.dtype != np.uint8 or not image.flags.c_contiguous or image.base is not None:
+            return
+        with self._lock:
+            free = self._free.setdefault(image.shape, [])
+            if len(free) < self.max_free:
+                free.append(image)
+
+    def close(self) -> None:
+        """Drop the free buffers."""
+        with self._lock:
+            self._free.clear()
+
+
+@dataclass(frozen=True, slots=True)
+class SharedFrameRef:
+    """Picklable handle to a SharedFramePool buffer — a few bytes instead of the pixels."""
+    name: str                # SharedMemory block name
+    shape: tuple[int, ...]
+
+    def attach(self) -> tuple[SharedMemory, np.ndarray]:
+        """
+        Map the buffer in this process, without copying. Keep the SharedMemory
+        referenced while using the array and close() it afterwards.
+
+        The block stays the producer's: exiting after close() leaves it in place.
+        """
+        if sys.version_info >= (3, 13):
+            shm = SharedMemory(name=self.name, track=False)
+        else:
+            shm = SharedMemory(name=self.name)
+            # Attaching registers the block with this process's resource
+            # tracker, which would unlink it when this process exits
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm, np.ndarray(self.shape, np.uint8, buffer=shm.buf)
+
+
+class SharedFramePool:
+    """
+    FramePool whose buffers live in multiprocessing shared memory.
+
+    Same acquire()/release() contract, so adapters don't know the difference.
+    A consumer in another process (Layer 2) gets `ref(frame.image)` instead of
+    the pixels and maps the block itself; the producer must not release the
+    frame until that consumer is done with it.
+
+    Up to `slots` blocks are created per shape. When all of them are in use,
+    acquire() falls back to an ordinary array, which ref() returns None for.
+    Blocks live until close().
+    """
+
+    def __init__(self, slots: int = 8):
+        self.slots = slots
+        self._blocks: dict[int, SharedMemory] = {}  # id(buffer) → its block
+        self._buffers: dict[tuple[int, ...], list[np.ndarray]] = {}  # every buffer, per shape
+        self._free: dict[tuple[int, ...], list[np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, shape: tuple[int, ...]) -> np.ndarray:
+        """A free shared buffer of this shape, a new one, or a plain array if out of slots."""
+        with self._lock:
+            free = self._free.get(shape)
+            if free:
+                return free.pop()
+            owned = self._buffers.setdefault(shape, [])
+            if len(owned) < self.slots:
+                shm = SharedMemory(create=True, size=int(np.prod(shape)))
+                image = np.ndarray(shape, np.uint8, buffer=shm.buf)
+                owned.append(image)  # keeps id(image) valid as the _blocks key
+                self._blocks[id(image)] = shm
+                return image
+        return np.empty(shape, dtype=np.uint8)
+
+    def release(self, image: np.ndarray) -> None:
+        """Take a buffer back. Arrays that aren't one of ours are ignored."""
+        with self._lock:
+            if id(image) in self._blocks:
+                self._free.setdefault(image.shape, []).append(image)
+
+    def ref(self, image: np.ndarray) -> SharedFrameRef | None:
+        """Handle another process can attach to, or None if image isn't a shared buffer."""
+        shm = self._blocks.get(id(image))
+        return SharedFrameRef(shm.name, image.shape) if shm is not None else None
+
+    def close(self) -> None:
+        """Unlink every block. Call once no frames from this pool are in use."""
+        with self._lock:
+            blocks = list(self._blocks.values())
+            self._blocks.clear()
+            self._buffers.clear()
+            self._free.clear()
+        for shm in blocks:
+            shm.unlink()
+            try:
+                shm.close()
+            except BufferError:
+                pass  # an array still maps it; freed when that goes away
+
+
+class SourceStatus(msgspec.Struct):
+    """
+    Real-time health status of a source adapter.
+
+    A msgspec Struct so the status API and WebSocket can encode it straight
+    to JSON (msgspec.json.encode) without building a dict per source.
+    """
     source_id: uuid.UUID
     state: SourceState = SourceState.OFFLINE
     fps_current: float = 0.0
@@ -68,17 +269,5 @@ class SourceStatus:
     latency_ms: float = 0.0
 
     def to_dict(self) -> dict:
-        """Serialize for Redis / WebSocket / API."""
-        return {
-            "source_id": str(self.source_id),
-            "state": self.state.value,
-            "fps_current": round(self.fps_current, 1),
-            "fps_target": self.fps_target,
-            "frames_total": self.frames_total,
-            "frames_dropped": self.frames_dropped,
-            "last_frame_at": self.last_frame_at.isoformat() if self.last_frame_at else None,
-            "uptime_s": round(self.uptime_s, 1),
-            "error": self.error,
-            "reconnect_count": self.reconnect_count,
-            "latency_ms": round(self.latency_ms, 1),
-        }
+        """Serialize for Redis / WebSocket / API (JSON-ready builtins)."""
+        return msgspec.to_builtins(self)
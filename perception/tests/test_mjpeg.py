@@ -0,0 +1,70 @@
+"""
+MultipartJpegReader against canned multipart/x-mixed-replace bodies.
+
+The reader only needs readline()/read() from the response, so a BytesIO
+stands in for the HTTP connection.
+"""
+
+import io
+
+import cv2
+import numpy as np
+
+from service.ingest.mjpeg import MultipartJpegReader
+
+
+def _jpeg(value: int) -> bytes:
+    ok, buf = cv2.imencode(".jpg", np.full((8, 8, 3), value, np.uint8))
+    assert ok
+    return buf.tobytes()
+
+
+def _part(jpeg: bytes, length: bool) -> bytes:
+    headers = b"Content-Type: image/jpeg\r\n"
+    if length:
+        headers += b"Content-Length: %d\r\n" % len(jpeg)
+    return b"--frame\r\n" + headers + b"\r\n" + jpeg + b"\r\n"
+
+
+def _reader(body: bytes) -> MultipartJpegReader:
+    return MultipartJpegReader(io.BytesIO(body), b"frame")
+
+
+def _read_all(reader: MultipartJpegReader) -> list[bytes]:
+    jpegs = []
+    while True:
+        ok, image, jpeg = reader.read()
+        if not ok:
+            assert image is None and jpeg is None
+            return jpegs
+        assert image.shape == (8, 8, 3)
+        jpegs.append(jpeg)
+
+
+def test_parts_with_content_length():
+    jpegs = [_jpeg(v) for v in (0, 80, 160, 240)]
+    body = b"".join(_part(j, length=True) for j in jpegs)
+
+    assert _read_all(_reader(body)) == jpegs
+
+
+def test_parts_without_content_length():
+    jpegs = [_jpeg(v) for v in (0, 80, 160, 240)]
+    body = b"".join(_part(j, length=False) for j in jpegs)
+
+    # The last part only ends at EOF, which is an incomplete part
+    assert _read_all(_reader(body)) == jpegs[:-1]
+
+
+def test_closing_delimiter_ends_last_part():
+    jpegs = [_jpeg(v) for v in (0, 80, 160, 240)]
+    body = b"".join(_part(j, length=False) for j in jpegs) + b"--frame--\r\n"
+
+    assert _read_all(_reader(body)) == jpegs
+
+
+def test_closing_delimiter_stops_without_reading_on():
+    jpeg = _jpeg(80)
+    body = _part(jpeg, length=True) + b"--frame--\r\n" + _part(_jpeg(160), length=True)
+
+    assert _read_all(_reader(body)) == [jpeg]
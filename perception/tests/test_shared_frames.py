@@ -0,0 +1,60 @@
+"""
+SharedFramePool buffers attached from another process.
+
+The consumer runs in a fresh interpreter, the way a Layer 2 worker would,
+and follows the attach()/close() contract before exiting.
+"""
+
+import pickle
+import subprocess
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+import numpy as np
+
+from service.models import SharedFramePool
+
+_CONSUMER = """
+import pickle, sys
+ref = pickle.loads(bytes.fromhex(sys.argv[1]))
+shm, image = ref.attach()
+total = int(image.sum())
+del image
+shm.close()
+print(total)
+"""
+
+
+def _consume(ref) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", _CONSUMER, pickle.dumps(ref).hex()],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def test_consumer_exit_leaves_block_to_producer():
+    pool = SharedFramePool(slots=1)
+    try:
+        image = pool.acquire((4, 4, 3))
+        image[:] = 7
+        ref = pool.ref(image)
+        assert ref is not None
+
+        for _ in range(2):  # a second consumer finds the block too
+            result = _consume(ref)
+            assert result.returncode == 0, result.stderr
+            assert int(result.stdout) == 7 * image.size
+            assert "leaked" not in result.stderr
+
+        # Still mapped by name, with the producer's pixels
+        shm = SharedMemory(name=ref.name)
+        try:
+            assert np.ndarray(ref.shape, np.uint8, buffer=shm.buf).sum() == 7 * image.size
+        finally:
+            shm.close()
+    finally:
+        pool.close()